@@ -1,17 +1,13 @@
 import socket
 import threading
-from queue import Queue
 from datetime import datetime
 
 print_lock = threading.Lock()
 target = ""
-queue = Queue()
 
-def grab_banner(port):
+def grab_banner(s, port):
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        socket.setdefaulttimeout(1)
-        s.connect((target, port))
+        s.settimeout(1)
         try:
             banner = s.recv(1024).decode().strip()
             if banner:
@@ -25,43 +21,39 @@ def grab_banner(port):
             s.send(b'Hello\r\n')
             
         banner = s.recv(1024).decode().strip()
-        s.close()
         return banner
     except:
         return "No Banner"
 
 def port_scan(port):
     try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        socket.setdefaulttimeout(0.5) 
-        result = s.connect_ex((target, port))
-        if result == 0:
-            banner = grab_banner(port)
-            with print_lock:
-                print(f"Port {port}: OPEN | Banner: {banner}")
-        s.close()
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+            s.settimeout(0.5)
+            result = s.connect_ex((target, port))
+            if result == 0:
+                # Read the banner over the probe connection instead of reconnecting
+                banner = grab_banner(s, port)
+                with print_lock:
+                    print(f"Port {port}: OPEN | Banner: {banner}")
     except:
         pass
 
-def threader():
-    while True:
-        worker = queue.get()
-        port_scan(worker)
-        queue.task_done()
+def worker(ports):
+    for port in ports:
+        port_scan(port)
 
 if __name__ == "__main__":
     target = input("Enter Target IP: ")
     print(f"Scanning target: {target}")
     print(f"Time started: {datetime.now()}")
 
-    for x in range(100):
-        t = threading.Thread(target=threader)
-        t.daemon = True
+    # Interleave the ports so each of the 100 threads gets a fixed share
+    threads = [threading.Thread(target=worker, args=(range(i, 1025, 100),), daemon=True)
+               for i in range(1, 101)]
+    for t in threads:
         t.start()
     
-    for worker in range(1, 1025):
-        queue.put(worker)
-    
-    queue.join()
+    for t in threads:
+        t.join()
 
     print(f"Time finished: {datetime.now()}")
@@ -1,45 +1,91 @@
+import errno
+import selectors
 import socket
-import threading
-from queue import Queue
+import sys
+import time
 from datetime import datetime
 
-print_lock = threading.Lock()
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
 target = ""
-queue = Queue()
-open_ports = []
+# results[port] is set to 1 when the port is open
+results = bytearray(65536)
 
-def port_scan(port):
-    try:
-        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        socket.setdefaulttimeout(0.5) 
-        result = s.connect_ex((target, port))
-        if result == 0:
-            with print_lock:
-                print(f"Port {port}: OPEN")
-                open_ports.append(port)
+def batch_size():
+    # Ports connected at once: stay under the open-file limit with some headroom
+    # for stdio and the selector, and below select()'s 512 sockets on Windows
+    if resource is None:
+        return 100
+    soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    if soft_limit == resource.RLIM_INFINITY:
+        return 500
+    return max(1, min(soft_limit - 32, 500))
+
+BATCH_SIZE = batch_size()
+
+def scan_batch(ports):
+    # Returns how many of the ports were probed; the rest did not fit in the fd limit
+    sel = selectors.DefaultSelector()
+    submitted = 0
+    for port in ports:
+        try:
+            s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        except OSError as e:
+            # Out of descriptors: finish the sockets in flight and retry the rest
+            if e.errno in (errno.EMFILE, errno.ENFILE) and submitted:
+                break
+            raise
+        submitted += 1
+        s.setblocking(False)
+        err = s.connect_ex((target, port))
+        if err in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+            sel.register(s, selectors.EVENT_WRITE, port)
+            continue
+        if err == 0:
+            results[port] = 1
         s.close()
-    except:
-        pass
 
-def threader():
-    while True:
-        worker = queue.get()
-        port_scan(worker)
-        queue.task_done()
+    # Writable means the handshake finished; SO_ERROR tells success from refusal
+    deadline = time.monotonic() + 0.5
+    while sel.get_map():
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        for key, _ in sel.select(remaining):
+            s = key.fileobj
+            if s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                results[key.data] = 1
+            sel.unregister(s)
+            s.close()
+
+    # Anything still pending timed out (filtered)
+    for key in list(sel.get_map().values()):
+        key.fileobj.close()
+    sel.close()
+    return submitted
+
+def scan_ports(ports):
+    ports = list(ports)
+    while ports:
+        ports = ports[scan_batch(ports[:BATCH_SIZE]):]
 
 if __name__ == "__main__":
     target = input("Enter Target IP: ")
+    try:
+        target = socket.gethostbyname(target)
+    except socket.gaierror:
+        print("Hostname could not be resolved.")
+        sys.exit()
     print(f"Scanning target: {target}")
     print(f"Time started: {datetime.now()}")
 
-    for x in range(100):
-        t = threading.Thread(target=threader)
-        t.daemon = True
-        t.start()
-    
-    for worker in range(1, 1025):
-        queue.put(worker)
-    
-    queue.join()
+    scan_ports(range(1, 1025))
+
+    open_ports = [port for port, is_open in enumerate(results) if is_open]
+    for port in open_ports:
+        print(f"Port {port}: OPEN")
 
     print(f"Time finished: {datetime.now()}")
@@ -1,10 +1,19 @@
 import socket
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
+
+def probe(target_ip, port):
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(0.5)
+        result = sock.connect_ex((target_ip, port))
+    return port if result == 0 else None
 
 def scan_target(target):
     try:
-        target_ip = socket.gethostbyname(target)
+        # Resolve once up front; workers only ever see the numeric address
+        target_ip = socket.getaddrinfo(target, None, socket.AF_INET, socket.SOCK_STREAM)[0][4][0]
     except socket.gaierror:
         print("Hostname could not be resolved.")
         sys.exit()
@@ -12,14 +21,11 @@ def scan_target(target):
     print(f"Scanning Target: {target_ip}")
     print(f"Time Started: {datetime.now()}")
 
+    executor = ThreadPoolExecutor(max_workers=200)
     try:
-        for port in range(1, 1025):
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.5)
-            result = sock.connect_ex((target_ip, port))
-            if result == 0:
+        for port in executor.map(partial(probe, target_ip), range(1, 1025)):
+            if port:
                 print(f"Port {port}: OPEN")
-            sock.close()
 
     except KeyboardInterrupt:
         print("Exiting Program.")
@@ -27,6 +33,9 @@ def scan_target(target):
     except socket.error:
         print("Could not connect to server.")
         sys.exit()
+    finally:
+        # Drop queued probes so Ctrl-C exits without finishing the sweep
+        executor.shutdown(cancel_futures=True)
 
 if __name__ == "__main__":
     target = input("Enter Target IP: ")
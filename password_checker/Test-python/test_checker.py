@@ -1,8 +1,13 @@
 """Unit tests for password strength checker."""
 
+import gc
+import sys
+import weakref
+
 import pytest
-from src.checker import PasswordChecker
-from src.utils import is_common_password, calculate_entropy
+import src.checker as checker_module
+from src.checker import PasswordChecker, clear_cache
+from src.utils import is_common_password, calculate_entropy, load_common_passwords
 
 
 class TestPasswordChecker:
@@ -84,6 +89,16 @@ class TestPasswordChecker:
         result = checker.check_password("Pass1111111")
         assert "serial" in result["feedback"].lower() or "serial" in str(result["recommendations"]).lower()
     
+    def test_repeated_chars_detection(self, checker: PasswordChecker) -> None:
+        """Test detection of a character making up most of the password."""
+        result = checker.check_password("aaaaaaaaB1!")
+        assert "Minimize repeating characters" in result["recommendations"]
+    
+    def test_unique_chars_not_flagged(self, checker: PasswordChecker) -> None:
+        """Test that passwords of distinct characters pass the repeat check."""
+        result = checker.check_password("Zq8#mW2!vK")
+        assert "✓ Minimal repeated characters" in result["feedback"]
+    
     # Test strength levels
     def test_weak_password(self, checker: PasswordChecker) -> None:
         """Test weak password detection."""
@@ -122,6 +137,46 @@ class TestPasswordChecker:
         assert "visual" in result
         assert isinstance(result["score"], int)
         assert 0 <= result["score"] <= 100
+    
+    def test_repeated_check_returns_fresh_result(self, checker: PasswordChecker) -> None:
+        """Test that cached results are not shared between calls."""
+        first = checker.check_password("abc")
+        first["recommendations"].clear()
+        second = checker.check_password("abc")
+        assert second["recommendations"]
+        assert second["score"] == first["score"]
+    
+    def test_cache_does_not_keep_checker_alive(self) -> None:
+        """Test that checking passwords does not pin the checker in memory."""
+        checker = PasswordChecker()
+        checker.check_password("S0me#Pass")
+        ref = weakref.ref(checker)
+        del checker
+        gc.collect()
+        assert ref() is None
+    
+    def test_instance_settings_respected(self) -> None:
+        """Test that a checker's own max_score applies despite shared caching."""
+        PasswordChecker().check_password("Zq8#mW2!vK9pLx4&")
+        checker = PasswordChecker()
+        checker.max_score = 50
+        assert checker.check_password("Zq8#mW2!vK9pLx4&")["score"] == 50
+    
+    def test_subclass_overrides_respected(self) -> None:
+        """Test that overridden checks are used instead of cached results."""
+        class LenientChecker(PasswordChecker):
+            def _check_length(self, password):
+                return f"Length: {len(password)} characters", 20, []
+        
+        PasswordChecker().check_password("Pass1")
+        assert LenientChecker().check_password("Pass1")["score"] > \
+            PasswordChecker().check_password("Pass1")["score"]
+    
+    def test_clear_cache(self, checker: PasswordChecker) -> None:
+        """Test that clearing the cache still gives identical results."""
+        first = checker.check_password("S0me#Pass")
+        clear_cache()
+        assert checker.check_password("S0me#Pass") == first
 
 
 class TestCommonPasswordDetection:
@@ -142,6 +197,69 @@ class TestCommonPasswordDetection:
         """Test case insensitive common password detection."""
         assert is_common_password("PASSWORD") == True
         assert is_common_password("Password") == True
+    
+    def test_large_wordlist(self, tmp_path) -> None:
+        """Test lookups against a memory-mapped sorted wordlist."""
+        words = sorted(["zxcvbnm", "hunter2", "correcthorse", "a", "trustno1"])
+        wordlist = tmp_path / "wordlist.txt"
+        wordlist.write_text("\n".join(words) + "\n")
+        
+        load_common_passwords(str(wordlist))
+        try:
+            for word in words:
+                assert is_common_password(word) == True
+            assert is_common_password("HUNTER2") == True
+            assert is_common_password("hunter") == False
+            assert is_common_password("zzz") == False
+            assert is_common_password("password") == True
+        finally:
+            load_common_passwords(None)
+        
+        assert is_common_password("hunter2") == False
+    
+    def test_unsorted_wordlist_rejected(self, tmp_path) -> None:
+        """Test that unsorted or mixed-case wordlists are refused on load."""
+        for content in ("zxcvbnm\nhunter2\n", "Hunter2\nzxcvbnm\n"):
+            wordlist = tmp_path / "wordlist.txt"
+            wordlist.write_text(content)
+            with pytest.raises(ValueError):
+                load_common_passwords(str(wordlist))
+        assert is_common_password("zxcvbnm") == False
+    
+    def test_failed_reload_keeps_wordlist(self, tmp_path) -> None:
+        """Test that a rejected or missing wordlist leaves the loaded one active."""
+        wordlist = tmp_path / "wordlist.txt"
+        wordlist.write_text("hunter2\nzxcvbnm\n")
+        unsorted = tmp_path / "unsorted.txt"
+        unsorted.write_text("zxcvbnm\nhunter2\n")
+        
+        load_common_passwords(str(wordlist))
+        try:
+            with pytest.raises(ValueError):
+                load_common_passwords(str(unsorted))
+            with pytest.raises(OSError):
+                load_common_passwords(str(tmp_path / "missing.txt"))
+            assert is_common_password("hunter2") == True
+        finally:
+            load_common_passwords(None)
+    
+    def test_wordlist_applies_to_checked_password(self, tmp_path) -> None:
+        """Test that loading a wordlist affects passwords checked before it."""
+        checker = PasswordChecker()
+        before = checker.check_password("hunter2")
+        assert "common" not in before["feedback"].lower()
+        
+        # Load into the utils module the checker imported, which may not be src.utils
+        checker_utils = sys.modules[checker_module.is_common_password.__module__]
+        wordlist = tmp_path / "wordlist.txt"
+        wordlist.write_text("hunter2\n")
+        checker_utils.load_common_passwords(str(wordlist))
+        try:
+            after = checker.check_password("hunter2")
+            assert "common" in after["feedback"].lower()
+            assert after["score"] < before["score"]
+        finally:
+            checker_utils.load_common_passwords(None)
 
 
 class TestEntropy:
@@ -169,6 +287,10 @@ class TestEntropy:
         entropy_short = calculate_entropy("Pass1")
         entropy_long = calculate_entropy("Pass1234567890")
         assert entropy_long > entropy_short
+    
+    def test_non_ascii_digits_count(self) -> None:
+        """Test that non-ASCII digits widen the charset like ASCII ones."""
+        assert calculate_entropy("pass\u0663word") == calculate_entropy("pass3word")
 
 
 if __name__ == "__main__":
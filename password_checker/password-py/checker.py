@@ -1,9 +1,58 @@
 """Core password strength checking module."""
 
-from typing import Dict, List, Tuple, Any
+import re
+import string
+from bisect import bisect_right
+from collections import Counter, OrderedDict
+from typing import Dict, FrozenSet, List, Tuple, Any
 from utils import is_common_password, calculate_entropy
 
 
+_UPPERCASE: FrozenSet[str] = frozenset(string.ascii_uppercase)
+_LOWERCASE: FrozenSet[str] = frozenset(string.ascii_lowercase)
+_DIGITS: FrozenSet[str] = frozenset(string.digits)
+_SPECIAL_CHARS: FrozenSet[str] = frozenset("!@#$%^&*()_+-=[]{}|;:,.<>?")
+
+_SEQUENTIAL_PATTERNS: Tuple[str, ...] = (
+    'abc', 'bcd', 'cde', 'def', 'efg', 'fgh', 'ghi', 'hij', 'ijk',
+    'jkl', 'klm', 'lmn', 'mno', 'nop', 'opq', 'pqr', 'qrs', 'rst',
+    'stu', 'tuv', 'uvw', 'vwx', 'wxy', 'xyz',
+    '123', '234', '345', '456', '567', '678', '789', '890'
+)
+
+# Common phone number and serial patterns
+_NUMERIC_PATTERNS: Tuple[str, ...] = (
+    '0123456789',  # Full ascending sequence
+    '9876543210',  # Full descending sequence
+    '1234567890',  # Common numeric pattern
+    '0987654321',  # Reverse numeric pattern
+    '01234567',    # Phone-like ascending
+    '87654321',    # Phone-like descending
+    '1234567',     # Short ascending
+    '7654321',     # Short descending
+)
+
+# Repeated-digit phone number formats ('1111111', '2222222', ...)
+_REPEATED_DIGIT_PATTERNS: Tuple[str, ...] = tuple(digit * 7 for digit in "0123456789")
+
+# Lowest score of each level above "Weak"
+_STRENGTH_THRESHOLDS: Tuple[int, ...] = (31, 51, 71, 86)
+_STRENGTH_LEVELS: Tuple[str, ...] = ("Weak", "Fair", "Good", "Strong", "Very Strong")
+
+# Strength bars for each possible number of filled segments (0-10)
+_VISUAL_BARS: Tuple[str, ...] = tuple("█" * filled + "░" * (10 - filled) for filled in range(11))
+
+# Memoized analyses keyed on (password, is_common, max_score, min_length).
+# Holds up to _ANALYSIS_CACHE_SIZE recently checked passwords in plaintext
+# until they are evicted or clear_cache() is called.
+_ANALYSIS_CACHE: "OrderedDict[Tuple[str, bool, int, int], Tuple[Any, ...]]" = OrderedDict()
+_ANALYSIS_CACHE_SIZE = 2048
+
+# Each pattern family compiled into one alternation so a check is a single C-level scan
+_SEQUENTIAL_RE = re.compile("|".join(map(re.escape, _SEQUENTIAL_PATTERNS)))
+_SERIAL_RE = re.compile("|".join(map(re.escape, _NUMERIC_PATTERNS + _REPEATED_DIGIT_PATTERNS)))
+
+
 class PasswordChecker:
     """Analyzes password strength and provides security recommendations."""
     
@@ -22,9 +71,52 @@ class PasswordChecker:
         Returns:
             dict: Contains score, strength level, feedback, and recommendations
         """
+        # The wordlist lookup stays outside the cache so loading a new
+        # wordlist takes effect immediately for already-checked passwords
+        is_common = bool(password) and is_common_password(password)
+        score, strength, feedback, recommendations = self._analyze_cached(password, is_common)
+        return self._create_report(score, strength, feedback, list(recommendations))
+    
+    def _analyze_cached(self, password: str, 
+                        is_common: bool) -> Tuple[int, str, str, Tuple[str, ...]]:
+        """
+        Return the memoized analysis of a password, computing it on a miss.
+        
+        Results are shared between instances through a module-level LRU
+        keyed on the password and every setting the analysis reads, so
+        checkers with different settings never see each other's results.
+        Subclasses may override the individual checks, so they bypass it.
+        """
+        if type(self) is not PasswordChecker:
+            return self._analyze(password, is_common)
+        
+        key = (password, is_common, self.max_score, self.min_length)
+        analysis = _ANALYSIS_CACHE.get(key)
+        if analysis is None:
+            analysis = self._analyze(password, is_common)
+            _ANALYSIS_CACHE[key] = analysis
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_SIZE:
+                _ANALYSIS_CACHE.popitem(last=False)
+        else:
+            _ANALYSIS_CACHE.move_to_end(key)
+        return analysis
+    
+    def _analyze(self, password: str, 
+                 is_common: bool) -> Tuple[int, str, str, Tuple[str, ...]]:
+        """
+        Score a password without building the report.
+        
+        Returns an immutable tuple so results can be safely shared from the cache.
+        
+        Args:
+            password (str): The password to check
+            is_common (bool): Whether the password is a known common password
+            
+        Returns:
+            tuple: (score, strength level, feedback, recommendations)
+        """
         if not password:
-            return self._create_report(0, "Weak", "Password is empty.", 
-                                       ["Enter a password to check"])
+            return 0, "Weak", "Password is empty.", ("Enter a password to check",)
         
         score: int = 0
         feedback: List[str] = []
@@ -36,37 +128,39 @@ class PasswordChecker:
         score += length_score
         recommendations.extend(length_rec)
         
+        # Per-character counts, shared by the type and repetition checks
+        char_counts = Counter(password)
+        
         # Character type checks
-        uppercase_score, uppercase_rec = self._check_uppercase(password)
-        score += uppercase_score
-        if uppercase_rec:
+        has_uppercase, has_lowercase, has_numbers, has_special = \
+            self._classify_chars(password, char_counts)
+        
+        if has_uppercase:
+            score += 10
             feedback.append("✓ Contains uppercase letters")
         else:
             recommendations.append("Add uppercase letters (A-Z)")
         
-        lowercase_score, lowercase_rec = self._check_lowercase(password)
-        score += lowercase_score
-        if lowercase_rec:
+        if has_lowercase:
+            score += 10
             feedback.append("✓ Contains lowercase letters")
         else:
             recommendations.append("Add lowercase letters (a-z)")
         
-        numbers_score, numbers_rec = self._check_numbers(password)
-        score += numbers_score
-        if numbers_rec:
+        if has_numbers:
+            score += 10
             feedback.append("✓ Contains numbers")
         else:
             recommendations.append("Add numbers (0-9)")
         
-        special_score, special_rec = self._check_special_chars(password)
-        score += special_score
-        if special_rec:
+        if has_special:
+            score += 15
             feedback.append("✓ Contains special characters")
         else:
             recommendations.append("Add special characters (!@#$%^&*)")
         
         # Pattern checks
-        sequential_score, _ = self._check_sequential_patterns(password)
+        sequential_score, serial_score = self._check_patterns(password)
         if sequential_score == 0:
             recommendations.append("Avoid sequential patterns (abc, 123, phone numbers)")
         else:
@@ -74,14 +168,13 @@ class PasswordChecker:
         score += sequential_score
         
         # Serial/Phone number checks
-        serial_score, _ = self._check_numeric_sequences(password)
         if serial_score == 0:
             recommendations.append("Avoid serial numbers or phone numbers (0987654321, 1234567890)")
         else:
             feedback.append("✓ No serial/phone number patterns")
         score += serial_score
         
-        repeated_score, _ = self._check_repeated_chars(password)
+        repeated_score, _ = self._check_repeated_chars(password, char_counts)
         if repeated_score == 0:
             recommendations.append("Minimize repeating characters")
         else:
@@ -89,7 +182,7 @@ class PasswordChecker:
         score += repeated_score
         
         # Common password check
-        if is_common_password(password):
+        if is_common:
             feedback.append("⚠ This is a commonly used password")
             recommendations.append("Choose a less common password")
             score -= 30
@@ -105,8 +198,7 @@ class PasswordChecker:
         # Determine strength level
         strength_level = self._determine_strength_level(score)
         
-        return self._create_report(score, strength_level, "\n".join(feedback), 
-                                   recommendations)
+        return score, strength_level, "\n".join(feedback), tuple(recommendations)
     
     def _check_length(self, password: str) -> Tuple[str, int, List[str]]:
         """Check password length."""
@@ -122,76 +214,44 @@ class PasswordChecker:
         else:
             return feedback, 20, []
     
-    def _check_uppercase(self, password: str) -> Tuple[int, bool]:
-        """Check for uppercase letters."""
-        has_uppercase = any(char.isupper() for char in password)
-        return (10 if has_uppercase else 0, has_uppercase)
-    
-    def _check_lowercase(self, password: str) -> Tuple[int, bool]:
-        """Check for lowercase letters."""
-        has_lowercase = any(char.islower() for char in password)
-        return (10 if has_lowercase else 0, has_lowercase)
-    
-    def _check_numbers(self, password: str) -> Tuple[int, bool]:
-        """Check for numbers."""
-        has_numbers = any(char.isdigit() for char in password)
-        return (10 if has_numbers else 0, has_numbers)
-    
-    def _check_special_chars(self, password: str) -> Tuple[int, bool]:
-        """Check for special characters."""
-        special_chars = set("!@#$%^&*()_+-=[]{}|;:,.<>?")
-        has_special = any(char in special_chars for char in password)
-        return (15 if has_special else 0, has_special)
-    
-    def _check_sequential_patterns(self, password: str) -> Tuple[int, bool]:
-        """Check for sequential patterns like 'abc' or '123'."""
-        sequential_patterns = [
-            'abc', 'bcd', 'cde', 'def', 'efg', 'fgh', 'ghi', 'hij', 'ijk',
-            'jkl', 'klm', 'lmn', 'mno', 'nop', 'opq', 'pqr', 'qrs', 'rst',
-            'stu', 'tuv', 'uvw', 'vwx', 'wxy', 'xyz',
-            '123', '234', '345', '456', '567', '678', '789', '890'
-        ]
-        
-        password_lower = password.lower()
-        for pattern in sequential_patterns:
-            if pattern in password_lower:
-                return 0, False
+    def _classify_chars(self, password: str, 
+                        char_counts: Counter) -> Tuple[bool, bool, bool, bool]:
+        """Detect uppercase, lowercase, numeric and special characters."""
+        if password.isascii():
+            # frozenset.isdisjoint walks the string in C and stops at the first hit
+            return (not _UPPERCASE.isdisjoint(password),
+                    not _LOWERCASE.isdisjoint(password),
+                    not _DIGITS.isdisjoint(password),
+                    not _SPECIAL_CHARS.isdisjoint(password))
         
-        return 5, True
+        has_uppercase = has_lowercase = has_numbers = has_special = False
+        for char in char_counts:
+            if char.isupper():
+                has_uppercase = True
+            elif char.islower():
+                has_lowercase = True
+            elif char.isdigit():
+                has_numbers = True
+            elif char in _SPECIAL_CHARS:
+                has_special = True
+        return has_uppercase, has_lowercase, has_numbers, has_special
     
-    def _check_numeric_sequences(self, password: str) -> Tuple[int, bool]:
-        """Check for serial numbers and phone number patterns."""
-        # Common phone number and serial patterns
-        numeric_patterns = [
-            '0123456789',  # Full ascending sequence
-            '9876543210',  # Full descending sequence
-            '1234567890',  # Common numeric pattern
-            '0987654321',  # Reverse numeric pattern
-            '01234567',    # Phone-like ascending
-            '87654321',    # Phone-like descending
-            '1234567',     # Short ascending
-            '7654321',     # Short descending
-        ]
-        
-        for pattern in numeric_patterns:
-            if pattern in password:
-                return 0, False
-        
-        # Also check for common phone number formats
-        phone_pattern_checks = [
-            '1111111', '2222222', '3333333', '4444444', '5555555',
-            '6666666', '7777777', '8888888', '9999999', '0000000'
-        ]
-        
-        for pattern in phone_pattern_checks:
-            if pattern in password:
-                return 0, False
+    def _check_patterns(self, password: str) -> Tuple[int, int]:
+        """
+        Check for sequential ('abc', '123') and serial/phone number patterns.
         
-        return 5, True
+        Returns:
+            tuple: (sequential_score, serial_score)
+        """
+        password_lower = password.lower()
+        sequential_score = 0 if _SEQUENTIAL_RE.search(password_lower) else 5
+        serial_score = 0 if _SERIAL_RE.search(password_lower) else 5
+        return sequential_score, serial_score
     
-    def _check_repeated_chars(self, password: str) -> Tuple[int, bool]:
+    def _check_repeated_chars(self, password: str, 
+                              char_counts: Counter) -> Tuple[int, bool]:
         """Check for excessive repeated characters."""
-        max_repeat = max(password.count(char) for char in set(password)) if password else 0
+        max_repeat = max(char_counts.values()) if password else 0
         
         if max_repeat > len(password) // 2:
             return 0, False
@@ -200,16 +260,7 @@ class PasswordChecker:
     
     def _determine_strength_level(self, score: int) -> str:
         """Determine password strength level based on score."""
-        if score < 31:
-            return "Weak"
-        elif score < 51:
-            return "Fair"
-        elif score < 71:
-            return "Good"
-        elif score < 86:
-            return "Strong"
-        else:
-            return "Very Strong"
+        return _STRENGTH_LEVELS[bisect_right(_STRENGTH_THRESHOLDS, score)]
     
     def _create_report(self, score: int, strength: str, feedback: str, 
                       recommendations: List[str]) -> Dict[str, Any]:
@@ -224,6 +275,9 @@ class PasswordChecker:
     
     def _create_visual_bar(self, score: int) -> str:
         """Create a visual strength indicator."""
-        filled = int(score / 10)
-        empty = 10 - filled
-        return "█" * filled + "░" * empty + f" ({score}/100)"
+        return f"{_VISUAL_BARS[int(score / 10)]} ({score}/100)"
+
+
+def clear_cache() -> None:
+    """Discard all memoized results, including the passwords they are keyed on."""
+    _ANALYSIS_CACHE.clear()
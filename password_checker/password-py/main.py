@@ -1,15 +1,35 @@
 """Command-line interface for password strength checker."""
 
+import argparse
 import getpass
 import sys
 from typing import Any
 from colorama import init, Fore, Style
 from checker import PasswordChecker
-from utils import get_password_strength_recommendations
+from utils import get_password_strength_recommendations, load_common_passwords
 
 
-# Initialize colorama for cross-platform colored output
-init(autoreset=True)
+_STRENGTH_COLORS: dict[str, str] = {
+    "Weak": Fore.RED,
+    "Fair": Fore.YELLOW,
+    "Good": Fore.LIGHTGREEN_EX,
+    "Strong": Fore.GREEN,
+    "Very Strong": Fore.LIGHTGREEN_EX
+}
+
+
+class _NoColor:
+    """Stand-in for colorama's Fore/Style that renders every color as ''."""
+    
+    def __getattr__(self, name: str) -> str:
+        return ""
+
+
+def disable_color() -> None:
+    """Switch all output to plain text, bypassing colorama."""
+    global Fore, Style, _STRENGTH_COLORS
+    Fore = Style = _NoColor()
+    _STRENGTH_COLORS = dict.fromkeys(_STRENGTH_COLORS, "")
 
 
 def print_header() -> None:
@@ -22,14 +42,7 @@ def print_header() -> None:
 
 def get_strength_color(strength: str) -> str:
     """Get color code for strength level."""
-    colors: dict[str, str] = {
-        "Weak": Fore.RED,
-        "Fair": Fore.YELLOW,
-        "Good": Fore.LIGHTGREEN_EX,
-        "Strong": Fore.GREEN,
-        "Very Strong": Fore.LIGHTGREEN_EX
-    }
-    return colors.get(strength, Fore.WHITE)
+    return _STRENGTH_COLORS.get(strength, Fore.WHITE)
 
 
 def print_result(result: dict[str, Any]) -> None:
@@ -75,9 +88,26 @@ def print_result(result: dict[str, Any]) -> None:
 
 def main() -> None:
     """Main function for CLI interface."""
+    parser = argparse.ArgumentParser(description="Password strength checker")
+    parser.add_argument("--no-color", action="store_true",
+                        help="print plain text without ANSI colors")
+    parser.add_argument("--wordlist", metavar="PATH",
+                        help="sorted, lowercase common-password list to check against")
+    args = parser.parse_args()
+    
+    # Color only interactive terminals; piped or --no-color output stays plain
+    if sys.stdout.isatty() and not args.no_color:
+        # Initialize colorama for cross-platform colored output
+        init(autoreset=True)
+    else:
+        disable_color()
+    
     try:
         print_header()
         
+        if args.wordlist:
+            load_common_passwords(args.wordlist)
+        
         checker = PasswordChecker()
         
         while True:
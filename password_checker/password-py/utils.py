@@ -1,8 +1,10 @@
 """Utility functions for password checking."""
 
 import math
+import mmap
+import os
 import string
-from typing import List
+from typing import List, Optional, Tuple
 
 
 # Common passwords list (subset of most common passwords)
@@ -14,6 +16,40 @@ COMMON_PASSWORDS = {
     "ninja", "mustache", "password123", "admin", "root", "toor", "pass", "test"
 }
 
+# Optional large wordlist (e.g. rockyou), memory-mapped by load_common_passwords
+_common_wordlist: Optional[mmap.mmap] = None
+
+
+# Character classes used for entropy, as (members, bit flag, charset size)
+_CHARSET_CLASSES: Tuple[Tuple[str, int, int], ...] = (
+    (string.ascii_lowercase, 1, 26),
+    (string.ascii_uppercase, 2, 26),
+    (string.digits, 4, 10),
+    (string.punctuation, 8, 33),
+)
+
+
+def _build_charset_table() -> bytes:
+    """Build a bytes.translate table mapping each ASCII byte to its class flag."""
+    table = bytearray(256)
+    for members, flag, _ in _CHARSET_CLASSES:
+        for byte in members.encode("ascii"):
+            table[byte] = flag
+    return bytes(table)
+
+
+def _build_charset_bits() -> Tuple[float, ...]:
+    """Precompute log2(charset size) for every combination of class flags."""
+    bits = []
+    for mask in range(1 << len(_CHARSET_CLASSES)):
+        charset_size = sum(size for _, flag, size in _CHARSET_CLASSES if mask & flag)
+        bits.append(math.log2(charset_size) if charset_size else 0.0)
+    return tuple(bits)
+
+
+_CHARSET_TABLE = _build_charset_table()
+_CHARSET_BITS = _build_charset_bits()
+
 
 def is_common_password(password: str) -> bool:
     """
@@ -25,7 +61,79 @@ def is_common_password(password: str) -> bool:
     Returns:
         bool: True if password is common, False otherwise
     """
-    return password.lower() in COMMON_PASSWORDS
+    password = password.lower()
+    if password in COMMON_PASSWORDS:
+        return True
+    if _common_wordlist is not None:
+        return _in_sorted_wordlist(_common_wordlist, password.encode("utf-8"))
+    return False
+
+
+def load_common_passwords(path: Optional[str]) -> None:
+    """
+    Use a large on-disk wordlist in addition to the built-in common passwords.
+    
+    The file must hold one lowercase password per line, sorted bytewise
+    (e.g. ``LC_ALL=C sort -u``). It is memory-mapped and binary searched,
+    so memory use stays flat regardless of the wordlist size.
+    
+    Args:
+        path (str): Path to the sorted wordlist, or None to unload it
+        
+    Raises:
+        ValueError: If the first and last lines show the file is not
+            lowercase or not sorted
+    """
+    global _common_wordlist
+    
+    # Open and validate the new list first so a failed reload keeps the old one
+    wordlist = _open_wordlist(path) if path is not None else None
+    
+    if _common_wordlist is not None:
+        _common_wordlist.close()
+    _common_wordlist = wordlist
+
+
+def _open_wordlist(path: str) -> Optional[mmap.mmap]:
+    """Memory-map a wordlist and sanity-check its ordering; None if empty."""
+    with open(path, "rb") as wordlist_file:
+        if not os.fstat(wordlist_file.fileno()).st_size:
+            return None
+        wordlist = mmap.mmap(wordlist_file.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    # A full scan would defeat the mmap; the end lines catch the usual mistakes
+    first_end = wordlist.find(b"\n")
+    first = wordlist[:first_end if first_end != -1 else len(wordlist)].rstrip(b"\r")
+    last_end = len(wordlist)
+    while last_end and wordlist[last_end - 1] in b"\r\n":
+        last_end -= 1
+    last = wordlist[wordlist.rfind(b"\n", 0, last_end) + 1:last_end]
+    
+    if first > last or first != first.lower() or last != last.lower():
+        wordlist.close()
+        raise ValueError(f"Wordlist {path} must be lowercase and sorted bytewise "
+                         "(e.g. LC_ALL=C sort -u)")
+    
+    return wordlist
+
+
+def _in_sorted_wordlist(wordlist: mmap.mmap, word: bytes) -> bool:
+    """Binary search a sorted, newline-separated wordlist for an exact line."""
+    low, high = 0, len(wordlist)
+    while low < high:
+        middle = (low + high) // 2
+        start = wordlist.rfind(b"\n", 0, middle) + 1
+        end = wordlist.find(b"\n", start)
+        if end == -1:
+            end = len(wordlist)
+        line = wordlist[start:end].rstrip(b"\r")
+        if line < word:
+            low = end + 1
+        elif line > word:
+            high = start
+        else:
+            return True
+    return False
 
 
 def calculate_entropy(password: str) -> float:
@@ -44,22 +152,16 @@ def calculate_entropy(password: str) -> float:
     if not password:
         return 0.0
     
-    # Determine character set size
-    charset_size = 0
-    
-    if any(char in string.ascii_lowercase for char in password):
-        charset_size += 26
-    if any(char in string.ascii_uppercase for char in password):
-        charset_size += 26
-    if any(char.isdigit() for char in password):
-        charset_size += 10
-    if any(char in string.punctuation for char in password):
-        charset_size += 33
+    # Determine character set size from the classes present, in one C-level pass
+    mask = 0
+    for flag in set(password.encode("utf-8", "ignore").translate(_CHARSET_TABLE)):
+        mask |= flag
     
-    if charset_size == 0:
-        return 0.0
+    # Match the checker's str.isdigit() semantics for non-ASCII digits
+    if not mask & 4 and not password.isascii() and any(char.isdigit() for char in password):
+        mask |= 4
     
-    entropy = len(password) * math.log2(charset_size)
+    entropy = len(password) * _CHARSET_BITS[mask]
     return entropy
 
 